@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Scout Analytics - Generated Dataset Cache
+Content-addressed cache in front of the FMCG generators, keyed by seed,
+transaction count, catalog hash and generator version
+"""
+
+import argparse
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import pickle
+import time
+from datetime import date
+
+from fmcg_generators import GENERATORS, run_seeded, seed_generator
+
+CACHE_DIR = os.environ.get("FMCG_CACHE_DIR", ".fmcg_cache")
+CACHE_MAX_BYTES = int(os.environ.get("FMCG_CACHE_MAX_MB", "512")) * 1024 * 1024
+
+
+def _digest(payload):
+    """Stable SHA-256 of a JSON-serialisable payload"""
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def catalog_hash(generator):
+    """Hash of the brand catalog the generator samples from"""
+    spec = GENERATORS[generator]
+    module = importlib.import_module(spec["module"])
+    return _digest(getattr(module, spec["catalog"]))
+
+
+def generator_version(generator):
+    """Hash of the generator source, so any code change invalidates its entries"""
+    module = importlib.import_module(GENERATORS[generator]["module"])
+    with open(inspect.getsourcefile(module), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def cache_key(generator, num_transactions, seed):
+    """Content address for one generator invocation"""
+    return _digest({
+        "generator": generator,
+        "num_transactions": num_transactions,
+        "seed": seed,
+        "catalog": catalog_hash(generator),
+        "version": generator_version(generator),
+        # Both generators anchor their date window at datetime.now()
+        "anchor_date": date.today().isoformat(),
+    })
+
+
+def _entries(cache_dir):
+    """Cache files as (mtime, size, path), least recently used first"""
+    if not os.path.isdir(cache_dir):
+        return []
+    entries = []
+    for name in os.listdir(cache_dir):
+        if not name.endswith(".pkl"):
+            continue
+        path = os.path.join(cache_dir, name)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:  # Evicted by another worker since listdir()
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    return sorted(entries)
+
+
+def evict(cache_dir=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+    """Drop least recently used entries until the cache fits in max_bytes"""
+    entries = _entries(cache_dir)
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:  # Another worker evicted it first
+            pass
+        total -= size
+        removed += 1
+    return removed
+
+
+def clear_cache(cache_dir=CACHE_DIR):
+    """Remove every cached dataset"""
+    return evict(cache_dir, max_bytes=-1)
+
+
+def cached_generate(generator="comprehensive", num_transactions=5000, seed=42,
+                    cache_dir=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+    """Return the generator's output for (seed, count), reusing a cached copy when present"""
+    key = cache_key(generator, num_transactions, seed)
+    path = os.path.join(cache_dir, f"{generator}_{key[:32]}.pkl")
+
+    try:
+        with open(path, "rb") as f:
+            result = pickle.load(f)
+        os.utime(path)  # Bump recency for LRU eviction
+    except FileNotFoundError:
+        pass  # Missing, or evicted by another worker mid-read: treat as a miss
+    else:
+        # Leave module state (e.g. market_shares) as a fresh seeded run would
+        seed_generator(generator, seed)
+        return result
+
+    result = run_seeded(generator, num_transactions, seed)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)  # Atomic, so concurrent workers never read partial files
+    evict(cache_dir, max_bytes)
+    return result
+
+
+def main():
+    """Warm or clear the dataset cache from the command line"""
+    parser = argparse.ArgumentParser(description="Scout Analytics generated dataset cache")
+    parser.add_argument("--generator", choices=sorted(GENERATORS), default="comprehensive")
+    parser.add_argument("--transactions", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    parser.add_argument("--clear", action="store_true", help="Remove all cached datasets")
+    args = parser.parse_args()
+
+    if args.clear:
+        removed = clear_cache(args.cache_dir)
+        print(f"🧹 Removed {removed} cached dataset(s) from {args.cache_dir}")
+        return
+
+    started = time.perf_counter()
+    result = cached_generate(args.generator, args.transactions, args.seed, args.cache_dir)
+    elapsed = time.perf_counter() - started
+
+    print(f"✅ {args.generator}: {len(result[0]):,} transactions in {elapsed * 1000:.1f} ms")
+    entries = _entries(args.cache_dir)
+    print(f"📁 Cache: {len(entries)} dataset(s), {sum(s for _, s, _ in entries) / 1024 / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Scout Analytics - Stratified Dataset Sampler
+Keeps a bounded uniform sample plus per-stratum minimums while a large
+dataset streams past, so a small, representative dev subset falls out of the
+same run
+"""
+
+import heapq
+import json
+import random
+from datetime import datetime
+
+# Largest subset vs full-run share gap (percentage points) still called representative
+SHARE_DRIFT_TOLERANCE = 5.0
+
+
+class StratifiedReservoir:
+    """Uniform bottom-k sample of the stream, topped up to a floor per stratum.
+
+    Every transaction draws one random priority. The ``sample_size`` lowest
+    priorities overall form a uniform sample, so region and category shares
+    track the full stream; each region x category stratum (and each store
+    type) also keeps its ``floor`` lowest, so rare strata still appear. The
+    subset is the union. Memory is bounded by sample_size + floor x strata,
+    whatever the stream length.
+
+    Sharing one priority across all heaps makes inclusion probabilities exact:
+    a kept transaction's probability is the largest threshold among the heaps
+    keeping it, where a full heap's threshold is its (k+1)-th lowest priority.
+
+    Uses its own RNG so that sampling never perturbs the generator's draws.
+    """
+
+    def __init__(self, sample_size=1000, floor=2, seed=None):
+        self.sample_size = sample_size
+        self.floor = floor
+        self.rng = random.Random(seed)
+        self.overall = []
+        self.strata_heaps = {}
+        self.region_counts = {}
+        self.category_counts = {}
+        self.offered = 0
+
+    def strata(self, transaction, items):
+        """Strata a transaction belongs to"""
+        keys = {(transaction["region"], item["category"]) for item in items}
+        keys.add(("store_type", transaction["store_type"]))
+        return keys
+
+    @staticmethod
+    def _push(heap, capacity, entry):
+        # Max-heap on priority holding k + 1 entries; the extra one is the threshold
+        if len(heap) < capacity:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+
+    def offer(self, transaction, items):
+        """Consider one transaction for the uniform sample and each of its strata"""
+        entry = (-self.rng.random(), self.offered, transaction, items)
+        self.offered += 1
+
+        region = transaction["region"]
+        self.region_counts[region] = self.region_counts.get(region, 0) + 1
+        for category in {item["category"] for item in items}:
+            self.category_counts[category] = self.category_counts.get(category, 0) + 1
+
+        self._push(self.overall, self.sample_size + 1, entry)
+        for key in self.strata(transaction, items):
+            self._push(self.strata_heaps.setdefault(key, []), self.floor + 1, entry)
+
+    def _members(self):
+        """{position: (transaction, items, inclusion probability)} of the subset"""
+        members = {}
+        for heap, capacity in [(self.overall, self.sample_size + 1)] + \
+                [(heap, self.floor + 1) for heap in self.strata_heaps.values()]:
+            full = len(heap) == capacity
+            threshold = -heap[0][0] if full else 1.0
+            for entry in heap[1:] if full else heap:
+                _, position, transaction, items = entry
+                kept = members.get(position)
+                if kept is None or kept[2] < threshold:
+                    members[position] = (transaction, items, threshold)
+        return members
+
+    def sample(self):
+        """Sampled (transaction, items) pairs in original stream order"""
+        members = self._members()
+        return [members[position][:2] for position in sorted(members)]
+
+    def inclusion_probabilities(self):
+        """{transaction ID: probability it was sampled}, for reweighting subset totals"""
+        return {transaction["id"]: probability for transaction, _, probability in self._members().values()}
+
+
+def share_drift(reservoir, pairs):
+    """Largest gap, in percentage points, between subset and full-stream shares.
+
+    Compares the share of transactions per region and the share of
+    transactions containing each category.
+    """
+    regions = {}
+    categories = {}
+    for transaction, items in pairs:
+        regions[transaction["region"]] = regions.get(transaction["region"], 0) + 1
+        for category in {item["category"] for item in items}:
+            categories[category] = categories.get(category, 0) + 1
+
+    def drift(full_counts, subset_counts):
+        return max((abs(subset_counts.get(key, 0) / max(len(pairs), 1) - count / reservoir.offered) * 100
+                    for key, count in full_counts.items()), default=0.0)
+
+    return {
+        "region": round(drift(reservoir.region_counts, regions), 2),
+        "category": round(drift(reservoir.category_counts, categories), 2),
+    }
+
+
+def sample_stream(pairs, reservoir):
+    """Pass (transaction, items) pairs through, offering each to the reservoir"""
+    for transaction, items in pairs:
+        reservoir.offer(transaction, items)
+        yield transaction, items
+
+
+def build_subset(reservoir, products, stores=None):
+    """Sampled transactions with the items, stores and products they reference"""
+    pairs = reservoir.sample()
+    probabilities = reservoir.inclusion_probabilities()
+    store_ids = {transaction["store_id"] for transaction, _ in pairs}
+    product_names = {item["product_name"] for _, items in pairs for item in items}
+
+    if stores is not None:
+        subset_stores = [store for store in stores if store["id"] in store_ids]
+    else:
+        # The realistic generator only records store IDs on transactions
+        subset_stores = {}
+        for transaction, _ in pairs:
+            subset_stores.setdefault(transaction["store_id"], {
+                "id": transaction["store_id"],
+                "type": transaction["store_type"],
+                "region": transaction["region"],
+            })
+        subset_stores = list(subset_stores.values())
+
+    return {
+        "transactions": [transaction for transaction, _ in pairs],
+        "transaction_items": [item for _, items in pairs for item in items],
+        "products": [product for product in products if product["name"] in product_names],
+        "stores": subset_stores,
+        "metadata": {
+            "generated_at": datetime.now().isoformat(),
+            "sampled_from": reservoir.offered,
+            "sample_size": reservoir.sample_size,
+            "floor": reservoir.floor,
+            "strata": len(reservoir.strata_heaps),
+            "total_transactions": len(pairs),
+            "share_drift": share_drift(reservoir, pairs),
+            # Horvitz-Thompson weights: sum weight x value to estimate full-run totals
+            "inclusion_weights": {transaction["id"]: round(1 / probabilities[transaction["id"]], 4)
+                                  for transaction, _ in pairs},
+        },
+    }
+
+
+def write_subset_json(path, subset):
+    """Save a subset in the same layout as the generators' JSON output"""
+    with open(path, "w") as f:
+        json.dump(subset, f, indent=2, default=str)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Scout Analytics - FMCG Generator Registry
+Seeded entry points into the two FMCG generators, shared by the dataset
+cache, the SQL seed emitter and other tooling
+"""
+
+import importlib
+import random
+
+import numpy as np
+
+
+def _reseed_market_shares(module):
+    """Market shares are drawn at import time; redraw them under the seed"""
+    module.market_shares = module.generate_market_shares()
+
+
+def _stream_comprehensive(module, num_transactions):
+    customers = module.generate_customer_names()
+    stores = module.generate_stores()
+    return module.iter_transactions(num_transactions, customers, stores), module.generate_products(), stores
+
+
+def _stream_realistic(module, num_transactions):
+    # Stores are only IDs on transactions; consumers derive them from the stream
+    return module.iter_fmcg_transactions(num_transactions), module.generate_products(), None
+
+
+# Available generators: module, batch entry point, the catalog it samples from,
+# state to redraw after seeding, and a lazy (pairs, products, stores) factory
+GENERATORS = {
+    "comprehensive": {
+        "module": "generate_comprehensive_fmcg_dataset",
+        "function": "generate_transactions",
+        "catalog": "BRANDS_PORTFOLIO",
+        "prepare": None,
+        "stream": _stream_comprehensive,
+    },
+    "realistic": {
+        "module": "generate_realistic_fmcg_dataset",
+        "function": "generate_fmcg_dataset",
+        "catalog": "brands_data",
+        "prepare": _reseed_market_shares,
+        "stream": _stream_realistic,
+    },
+}
+
+
+def seed_generator(generator, seed):
+    """Import a generator module with both RNGs seeded"""
+    spec = GENERATORS[generator]
+    module = importlib.import_module(spec["module"])
+    random.seed(seed)
+    np.random.seed(seed)
+    if spec["prepare"]:
+        spec["prepare"](module)
+    return module
+
+
+def run_seeded(generator, num_transactions, seed):
+    """Run a generator's batch entry point with both RNGs seeded"""
+    module = seed_generator(generator, seed)
+    return getattr(module, GENERATORS[generator]["function"])(num_transactions)
+
+
+def stream_seeded(generator, num_transactions, seed):
+    """Seeded (pairs, products, stores) without materialising the transactions.
+
+    ``pairs`` yields (transaction, items) lazily; ``stores`` is None when the
+    generator only records store IDs on transactions.
+    """
+    module = seed_generator(generator, seed)
+    return GENERATORS[generator]["stream"](module, num_transactions)
+
+
+def stream_store_arrivals(days, seed, store_scale=50, traffic_scale=1.0):
+    """Seeded (pairs, products, stores) from the per-store arrival simulation"""
+    module = seed_generator("comprehensive", seed)
+    customers = module.generate_customer_names()
+    stores = module.generate_stores(store_scale)
+    pairs = module.iter_store_transactions(stores, customers, days, np.random.default_rng(seed),
+                                           traffic_scale=traffic_scale)
+    return pairs, module.generate_products(), stores
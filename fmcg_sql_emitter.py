@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Scout Analytics - Bulk SQL Seed Emitter
+Writes generated FMCG datasets as chunked multi-row INSERT or COPY blocks
+matching the column order of the final Supabase schema
+"""
+
+import argparse
+import sys
+import time
+
+from fmcg_generators import GENERATORS, stream_seeded, stream_store_arrivals
+from fmcg_dataset_sampler import (SHARE_DRIFT_TOLERANCE, StratifiedReservoir, build_subset, sample_stream,
+                                  write_subset_json)
+from validate_fmcg_dataset import (DatasetValidator, iter_file_transactions, optional_json_array, print_report,
+                                   validate_stream)
+
+# Column order follows 20250617000000_final_comprehensive_schema_with_rls.sql;
+# columns the generators have no value for are left to their defaults.
+TABLE_COLUMNS = {
+    "stores": ["id", "name", "location", "barangay", "region", "store_type"],
+    "products": ["id", "name", "category", "unit_cost", "retail_price"],
+    "customers": ["customer_id", "name", "region"],
+    "transactions": ["id", "transaction_date", "total_amount", "customer_id", "store_id", "payment_method"],
+    "transaction_items": ["id", "transaction_id", "product_id", "quantity", "unit_price", "total_price"],
+}
+
+# Tables loaded with explicit integer IDs whose sequences must be advanced afterwards
+SEQUENCE_TABLES = ["stores", "products", "transactions", "transaction_items"]
+
+FORMATS = ("insert", "copy")
+
+
+def sql_literal(value):
+    """Render a Python value as a SQL literal for INSERT statements"""
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def copy_field(value):
+    """Render a Python value as a field of COPY's text format"""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    return (str(value)
+            .replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r"))
+
+
+class SqlSeedWriter:
+    """Streams a dataset into a seed file, one chunk of transactions at a time.
+
+    Generator IDs are strings (``txn_00001``, ``store_ncr_001``, ``prod_123``)
+    while the schema uses integer keys, so each is mapped to a stable integer.
+    Customers and unseen stores are written in the same chunk as the first
+    transaction that references them, keeping every chunk FK-consistent.
+    """
+
+    def __init__(self, out, fmt="insert", chunk_size=1000, per_chunk_transactions=False):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown format {fmt!r}; expected one of {FORMATS}")
+        self.out = out
+        self.fmt = fmt
+        self.chunk_size = chunk_size
+        self.per_chunk_transactions = per_chunk_transactions
+        self.store_ids = {}
+        self.store_names = set()
+        self.product_ids = {}
+        self.customers = set()
+        self.max_ids = {table: 0 for table in SEQUENCE_TABLES}
+        self.item_id = 0
+        self.rows_written = {table: 0 for table in TABLE_COLUMNS}
+
+    def _write_rows(self, table, rows):
+        if not rows:
+            return
+        columns = TABLE_COLUMNS[table]
+        column_list = ", ".join(columns)
+        if self.fmt == "copy":
+            self.out.write(f"COPY public.{table} ({column_list}) FROM stdin;\n")
+            for row in rows:
+                self.out.write("\t".join(copy_field(value) for value in row))
+                self.out.write("\n")
+            self.out.write("\\.\n")
+        else:
+            self.out.write(f"INSERT INTO public.{table} ({column_list}) VALUES\n")
+            self.out.write(",\n".join("(" + ", ".join(sql_literal(value) for value in row) + ")"
+                                      for row in rows))
+            self.out.write(";\n")
+        self.rows_written[table] += len(rows)
+
+    def _begin(self):
+        if self.per_chunk_transactions:
+            self.out.write("BEGIN;\n")
+
+    def _commit(self):
+        if self.per_chunk_transactions:
+            self.out.write("COMMIT;\n")
+        self.out.write("\n")
+
+    def _store_row(self, store_key, name, location, barangay, region, store_type):
+        store_id = len(self.store_ids) + 1
+        self.store_ids[store_key] = store_id
+        self.max_ids["stores"] = store_id
+        # stores.name is UNIQUE but generated names repeat ("Tindahan ni Aling Rosa")
+        if name in self.store_names:
+            name = f"{name} #{store_id}"
+        self.store_names.add(name)
+        return [store_id, name, location, barangay, region, store_type]
+
+    def write_header(self):
+        self.out.write("-- Scout Analytics seed data generated by fmcg_sql_emitter.py\n")
+        self.out.write("SET client_encoding = 'UTF8';\n\n")
+
+    def write_products(self, products):
+        """Write the product catalog; items are matched to it by product name"""
+        rows = []
+        for product in products:
+            if product["name"] in self.product_ids:
+                continue
+            product_id = len(self.product_ids) + 1
+            self.product_ids[product["name"]] = product_id
+            if "base_price" in product:
+                retail_price = product["base_price"]
+            else:
+                retail_price = round((product["price_range_min"] + product["price_range_max"]) / 2, 2)
+            rows.append([product_id, product["name"], product["category"], product["unit_cost"], retail_price])
+        self.max_ids["products"] = len(self.product_ids)
+        self._begin()
+        self._write_rows("products", rows)
+        self._commit()
+
+    def write_stores(self, stores):
+        """Write a full store list, as returned by generate_stores()"""
+        rows = [
+            self._store_row(store["id"], store["name"], store.get("address"), store.get("barangay"),
+                            store["region"], store["type"])
+            for store in stores
+            if store["id"] not in self.store_ids
+        ]
+        self._begin()
+        self._write_rows("stores", rows)
+        self._commit()
+
+    def _write_chunk(self, chunk):
+        customer_rows = []
+        store_rows = []
+        transaction_rows = []
+        item_rows = []
+
+        for transaction, items in chunk:
+            store_key = transaction["store_id"]
+            if store_key not in self.store_ids:
+                store_rows.append(self._store_row(store_key, store_key, None, transaction.get("barangay"),
+                                                  transaction["region"], transaction["store_type"]))
+
+            customer_id = transaction["customer_id"]
+            if customer_id not in self.customers:
+                self.customers.add(customer_id)
+                customer_rows.append([customer_id, transaction.get("customer_name", customer_id),
+                                      transaction["region"]])
+
+            transaction_id = int(transaction["id"].rsplit("_", 1)[1])
+            self.max_ids["transactions"] = max(self.max_ids["transactions"], transaction_id)
+            transaction_rows.append([
+                transaction_id,
+                transaction["transaction_date"],
+                transaction["total_amount"],
+                customer_id,
+                self.store_ids[store_key],
+                transaction["payment_method"],
+            ])
+
+            for item in items:
+                self.item_id += 1
+                item_rows.append([
+                    self.item_id,
+                    transaction_id,
+                    self.product_ids[item["product_name"]],
+                    item["quantity"],
+                    item["unit_price"],
+                    item["total_amount"],
+                ])
+
+        self.max_ids["transaction_items"] = self.item_id
+        self._begin()
+        self._write_rows("customers", customer_rows)
+        self._write_rows("stores", store_rows)
+        self._write_rows("transactions", transaction_rows)
+        self._write_rows("transaction_items", item_rows)
+        self._commit()
+
+    def write_transactions(self, pairs):
+        """Write (transaction, items) pairs in chunks of ``chunk_size`` transactions"""
+        chunk = []
+        for pair in pairs:
+            chunk.append(pair)
+            if len(chunk) >= self.chunk_size:
+                self._write_chunk(chunk)
+                chunk = []
+        if chunk:
+            self._write_chunk(chunk)
+
+    def write_footer(self):
+        """Advance the serial sequences past the explicitly loaded IDs"""
+        for table in SEQUENCE_TABLES:
+            if self.max_ids[table]:
+                self.out.write(f"SELECT setval('public.{table}_id_seq', {self.max_ids[table]});\n")
+
+
+def write_seed_file(path, pairs, products, stores=None, fmt="insert", chunk_size=1000,
+                    per_chunk_transactions=False):
+    """Write a complete seed file and return the number of rows per table"""
+    with open(path, "w", encoding="utf-8") as out:
+        writer = SqlSeedWriter(out, fmt, chunk_size, per_chunk_transactions)
+        writer.write_header()
+        writer.write_products(products)
+        if stores is not None:
+            writer.write_stores(stores)
+        writer.write_transactions(pairs)
+        writer.write_footer()
+    return writer.rows_written
+
+
+def _group_items(subset):
+    """Items of a subset grouped per transaction, in transaction order"""
+    grouped = {transaction["id"]: [] for transaction in subset["transactions"]}
+    for item in subset["transaction_items"]:
+        grouped[item["transaction_id"]].append(item)
+    return list(grouped.values())
+
+
+def main():
+    """Emit a seed file from a generator run or an existing JSON dataset"""
+    parser = argparse.ArgumentParser(description="Scout Analytics bulk SQL seed emitter")
+    parser.add_argument("output", help="Path of the .sql file to write")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--generator", choices=sorted(GENERATORS), default="comprehensive")
+    source.add_argument("--from-json", metavar="PATH", help="Convert a dataset JSON file instead of generating")
+    parser.add_argument("--transactions", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--arrival-days", type=int, metavar="DAYS",
+                        help="Simulate per-store arrivals over DAYS days instead of --transactions")
+    parser.add_argument("--store-scale", type=int, default=50, help="Approximate store count for --arrival-days")
+    parser.add_argument("--traffic-scale", type=float, default=1.0, help="Multiplier on per-store traffic rates")
+    parser.add_argument("--format", choices=FORMATS, default="insert",
+                        help="Multi-row INSERT, or COPY ... FROM stdin (psql only)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Transactions per chunk")
+    parser.add_argument("--per-chunk-transactions", action="store_true",
+                        help="Wrap each chunk in BEGIN/COMMIT")
+    parser.add_argument("--subset", metavar="PATH",
+                        help="Also write a stratified dev subset (.sql or .json) from the same run")
+    parser.add_argument("--subset-size", type=int, default=1000,
+                        help="Transactions in the uniform part of the dev subset")
+    parser.add_argument("--subset-floor", type=int, default=2,
+                        help="Minimum transactions kept per region x category stratum and store type")
+    parser.add_argument("--validate", action="store_true",
+                        help="Check integrity invariants while writing; exit 1 on violations")
+    args = parser.parse_args()
+
+    validator = None
+    if args.from_json:
+        products = optional_json_array(args.from_json, "products")
+        stores = optional_json_array(args.from_json, "stores")
+        if products is None:
+            parser.error(f"{args.from_json} has no products table; regenerate it first")
+        if args.validate:
+            validator = DatasetValidator(products, stores)
+        pairs = iter_file_transactions(args.from_json, orphans=validator.orphan_items if validator else None)
+    elif args.arrival_days:
+        pairs, products, stores = stream_store_arrivals(args.arrival_days, args.seed, args.store_scale,
+                                                        args.traffic_scale)
+    else:
+        pairs, products, stores = stream_seeded(args.generator, args.transactions, args.seed)
+
+    if args.validate and validator is None:
+        validator = DatasetValidator(products, stores)
+    if validator is not None:
+        pairs = validate_stream(pairs, validator)
+
+    reservoir = None
+    if args.subset:
+        reservoir = StratifiedReservoir(args.subset_size, args.subset_floor, seed=args.seed)
+        pairs = sample_stream(pairs, reservoir)
+
+    print(f"🏭 Writing {args.format.upper()} seed to {args.output}...")
+    started = time.perf_counter()
+    rows = write_seed_file(args.output, pairs, products, stores, args.format,
+                           args.chunk_size, args.per_chunk_transactions)
+    elapsed = time.perf_counter() - started
+
+    for table, count in rows.items():
+        print(f"   {table}: {count:,} rows")
+    print(f"✅ Done in {elapsed:.1f}s")
+
+    if reservoir is not None:
+        subset = build_subset(reservoir, products, stores)
+        if args.subset.endswith(".sql"):
+            # Derived stores carry no names; let the writer rebuild them from transactions
+            write_seed_file(args.subset, zip(subset["transactions"], _group_items(subset)), subset["products"],
+                            subset["stores"] if stores is not None else None, args.format, args.chunk_size,
+                            args.per_chunk_transactions)
+        else:
+            write_subset_json(args.subset, subset)
+        drift = subset["metadata"]["share_drift"]
+        print(f"🧪 Dev subset: {len(subset['transactions']):,} transactions across "
+              f"{subset['metadata']['strata']} strata saved to {args.subset}")
+        marker = "⚠️" if max(drift.values()) > SHARE_DRIFT_TOLERANCE else "  "
+        print(f"{marker} Share drift vs full run: regions {drift['region']:.1f} pts, "
+              f"categories {drift['category']:.1f} pts (tolerance {SHARE_DRIFT_TOLERANCE:.0f})")
+
+    if validator is not None:
+        return print_report(validator.report())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
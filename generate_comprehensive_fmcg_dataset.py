@@ -8,8 +8,12 @@ with specified brands and competitors, weighted toward mega cities.
 import json
 import random
 import uuid
+import zlib
 from datetime import datetime, timedelta
 from decimal import Decimal
+from itertools import accumulate
+
+import numpy as np
 
 # Philippine regions with population-based weights (mega cities get higher weight)
 REGIONS = {
@@ -137,6 +141,20 @@ STORE_TYPES = {
     "Hypermarket": 0.02             # SM, Robinsons, etc.
 }
 
+# Mean daily transactions per store, by store type (used by the arrival simulation)
+STORE_TRAFFIC = {
+    "Sari-Sari Store": 40,
+    "Mini Mart": 120,
+    "Grocery Store": 300,
+    "Supermarket": 900,
+    "Convenience Store": 450,
+    "Hypermarket": 2500
+}
+
+# Transaction timing (business hours weighted)
+HOUR_WEIGHTS = [0.1, 0.1, 0.2, 0.3, 0.5, 0.8, 1.0, 1.0, 0.9, 0.8, 0.7, 0.6,
+                0.8, 0.9, 1.0, 1.0, 0.9, 0.8, 0.6, 0.4, 0.3, 0.2, 0.1, 0.1]
+
 def generate_customer_names():
     """Generate realistic Filipino customer names"""
     first_names = [
@@ -155,8 +173,13 @@ def generate_customer_names():
     
     return [f"{random.choice(first_names)} {random.choice(last_names)}" for _ in range(1500)]
 
-def generate_stores():
-    """Generate realistic store data across regions"""
+def generate_stores(store_scale=50, regions=None, store_types=None):
+    """Generate realistic store data across regions (about store_scale stores in total)"""
+    regions = regions if regions is not None else REGIONS
+    store_types = store_types if store_types is not None else STORE_TYPES
+    type_names = list(store_types.keys())
+    type_cum_weights = list(accumulate(store_types.values()))
+    
     stores = []
     store_names_by_type = {
         "Sari-Sari Store": ["Tindahan ni Aling {}", "Store ni Kuya {}", "{}'s Variety Store", "Mini Mart ni {}"],
@@ -170,11 +193,11 @@ def generate_stores():
     owner_names = ["Rosa", "Carmen", "Pedro", "Maria", "Juan", "Ana", "Jose", "Luz"]
     
     store_id = 1
-    for region, weight in REGIONS.items():
-        num_stores = max(5, int(50 * weight))  # More stores in bigger regions
+    for region, weight in regions.items():
+        num_stores = max(5, int(store_scale * weight))  # More stores in bigger regions
         
         for _ in range(num_stores):
-            store_type = random.choices(list(STORE_TYPES.keys()), weights=list(STORE_TYPES.values()))[0]
+            store_type = random.choices(type_names, cum_weights=type_cum_weights)[0]
             owner = random.choice(owner_names)
             store_name = random.choice(store_names_by_type[store_type]).format(owner)
             
@@ -190,15 +213,100 @@ def generate_stores():
     
     return stores
 
-def generate_transactions(num_transactions=5000):
-    """Generate realistic FMCG transactions with regional distribution"""
+def product_id_for(brand):
+    """Product ID shared by transaction items and the product catalog
     
-    customers = generate_customer_names()
-    stores = generate_stores()
-    brands = list(BRANDS_PORTFOLIO.keys())
+    crc32 rather than hash(), which is salted per process (PYTHONHASHSEED).
+    """
+    return f"prod_{zlib.crc32(brand.encode('utf-8')) % 1000:03d}"
+
+def build_transaction(index, store, transaction_date, customers, brands):
+    """Build one transaction and its basket for a store at a given time"""
+    region = store["region"]
     
-    transactions = []
-    transaction_items = []
+    # Customer selection (some customers are repeat buyers)
+    if random.random() < 0.3:  # 30% repeat customers
+        customer_name = random.choice(customers[:500])  # Top 500 customers more likely to repeat
+    else:
+        customer_name = random.choice(customers)
+    
+    transaction_id = f"txn_{index+1:05d}"
+    customer_id = f"cust_{zlib.crc32(customer_name.encode('utf-8')) % 10000:04d}"
+    
+    # Number of items (weighted toward smaller baskets)
+    num_items = random.choices([1, 2, 3, 4, 5, 6], weights=[40, 25, 15, 10, 6, 4])[0]
+    
+    transaction_total = 0
+    items = []
+    
+    # Generate items for this transaction
+    selected_brands = random.sample(brands, min(num_items, len(brands)))
+    
+    for j, brand in enumerate(selected_brands):
+        brand_info = BRANDS_PORTFOLIO[brand]
+        
+        # Quantity (most items bought in small quantities)
+        quantity = random.choices([1, 2, 3, 4, 5], weights=[50, 25, 15, 7, 3])[0]
+        
+        # Price with regional variation (mega cities slightly higher)
+        base_price = random.uniform(*brand_info["price_range"])
+        if region in ["National Capital Region (NCR)", "CALABARZON", "Central Luzon"]:
+            price_multiplier = random.uniform(1.05, 1.15)  # 5-15% higher in mega cities
+        else:
+            price_multiplier = random.uniform(0.95, 1.05)  # Slightly lower in other regions
+        
+        unit_price = round(base_price * price_multiplier, 2)
+        item_total = unit_price * quantity
+        transaction_total += item_total
+        
+        items.append({
+            "id": f"item_{index+1:05d}_{j+1:02d}",
+            "transaction_id": transaction_id,
+            "product_id": product_id_for(brand),
+            "product_name": brand,
+            "category": brand_info["category"],
+            "unit_price": unit_price,
+            "quantity": quantity,
+            "total_amount": round(item_total, 2)
+        })
+    
+    transaction = {
+        "id": transaction_id,
+        "customer_id": customer_id,
+        "customer_name": customer_name,
+        "store_id": store["id"],
+        "store_name": store["name"],
+        "store_type": store["type"],
+        "region": region,
+        "barangay": store["barangay"],
+        "transaction_date": transaction_date.isoformat(),
+        "total_amount": round(transaction_total, 2),
+        "payment_method": random.choices(
+            ["Cash", "GCash", "PayMaya", "Credit Card", "Bank Transfer"],
+            weights=[60, 20, 10, 7, 3]
+        )[0]
+    }
+    
+    return transaction, items
+
+def build_sampling_tables(stores, regions=None):
+    """Precompute the per-transaction sampling tables once per store universe"""
+    regions = regions if regions is not None else REGIONS
+    stores_by_region = {}
+    for store in stores:
+        stores_by_region.setdefault(store["region"], []).append(store)
+    
+    return {
+        "region_names": list(regions.keys()),
+        "region_cum_weights": list(accumulate(regions.values())),
+        "stores_by_region": stores_by_region,
+        "brands": list(BRANDS_PORTFOLIO.keys())
+    }
+
+def iter_transactions(num_transactions, customers, stores, tables=None):
+    """Yield (transaction, items) pairs one transaction at a time"""
+    tables = tables if tables is not None else build_sampling_tables(stores)
+    brands = tables["brands"]
     
     # Generate date range (last 6 months)
     end_date = datetime.now()
@@ -206,85 +314,76 @@ def generate_transactions(num_transactions=5000):
     
     for i in range(num_transactions):
         # Select region based on weights (mega cities get more transactions)
-        region = random.choices(list(REGIONS.keys()), weights=list(REGIONS.values()))[0]
+        region = random.choices(tables["region_names"], cum_weights=tables["region_cum_weights"])[0]
         
         # Select store from that region
-        region_stores = [s for s in stores if s["region"] == region]
-        store = random.choice(region_stores)
+        store = random.choice(tables["stores_by_region"][region])
         
         # Generate transaction date (more recent transactions weighted higher)
         days_ago = int(random.betavariate(2, 5) * 180)  # Beta distribution favors recent dates
         transaction_date = end_date - timedelta(days=days_ago)
         
-        # Transaction timing (business hours weighted)
-        hour_weights = [0.1, 0.1, 0.2, 0.3, 0.5, 0.8, 1.0, 1.0, 0.9, 0.8, 0.7, 0.6, 
-                       0.8, 0.9, 1.0, 1.0, 0.9, 0.8, 0.6, 0.4, 0.3, 0.2, 0.1, 0.1]
-        hour = random.choices(range(24), weights=hour_weights)[0]
+        hour = random.choices(range(24), weights=HOUR_WEIGHTS)[0]
         minute = random.randint(0, 59)
         
         transaction_date = transaction_date.replace(hour=hour, minute=minute)
         
-        # Customer selection (some customers are repeat buyers)
-        if random.random() < 0.3:  # 30% repeat customers
-            customer_name = random.choice(customers[:500])  # Top 500 customers more likely to repeat
-        else:
-            customer_name = random.choice(customers)
-        
-        transaction_id = f"txn_{i+1:05d}"
-        customer_id = f"cust_{hash(customer_name) % 10000:04d}"
-        
-        # Number of items (weighted toward smaller baskets)
-        num_items = random.choices([1, 2, 3, 4, 5, 6], weights=[40, 25, 15, 10, 6, 4])[0]
-        
-        transaction_total = 0
-        
-        # Generate items for this transaction
-        selected_brands = random.sample(brands, min(num_items, len(brands)))
-        
-        for j, brand in enumerate(selected_brands):
-            brand_info = BRANDS_PORTFOLIO[brand]
-            
-            # Quantity (most items bought in small quantities)
-            quantity = random.choices([1, 2, 3, 4, 5], weights=[50, 25, 15, 7, 3])[0]
-            
-            # Price with regional variation (mega cities slightly higher)
-            base_price = random.uniform(*brand_info["price_range"])
-            if region in ["National Capital Region (NCR)", "CALABARZON", "Central Luzon"]:
-                price_multiplier = random.uniform(1.05, 1.15)  # 5-15% higher in mega cities
-            else:
-                price_multiplier = random.uniform(0.95, 1.05)  # Slightly lower in other regions
-            
-            unit_price = round(base_price * price_multiplier, 2)
-            item_total = unit_price * quantity
-            transaction_total += item_total
-            
-            transaction_items.append({
-                "id": f"item_{i+1:05d}_{j+1:02d}",
-                "transaction_id": transaction_id,
-                "product_id": f"prod_{hash(brand) % 1000:03d}",
-                "product_name": brand,
-                "category": brand_info["category"],
-                "unit_price": unit_price,
-                "quantity": quantity,
-                "total_amount": round(item_total, 2)
-            })
-        
-        transactions.append({
-            "id": transaction_id,
-            "customer_id": customer_id,
-            "customer_name": customer_name,
-            "store_id": store["id"],
-            "store_name": store["name"],
-            "store_type": store["type"],
-            "region": region,
-            "barangay": store["barangay"],
-            "transaction_date": transaction_date.isoformat(),
-            "total_amount": round(transaction_total, 2),
-            "payment_method": random.choices(
-                ["Cash", "GCash", "PayMaya", "Credit Card", "Bank Transfer"],
-                weights=[60, 20, 10, 7, 3]
-            )[0]
-        })
+        yield build_transaction(i, store, transaction_date, customers, brands)
+
+def simulate_store_arrivals(stores, days=180, rng=None, traffic_skew=0.8, traffic_scale=1.0):
+    """Simulate per-store arrivals as a non-homogeneous Poisson process
+    
+    Each store gets a daily rate from STORE_TRAFFIC for its type, scaled by a
+    log-normal factor (mean 1) so some stores run hot. Within a day the
+    intensity follows HOUR_WEIGHTS and is constant per hour, so arrivals are
+    Poisson counts per store-hour placed uniformly within the hour. Work is
+    vectorized over all stores and hours; the only Python loop is per day.
+    traffic_scale thins every rate, e.g. for 100k-store universes.
+    
+    Yields (day, store_index, seconds) per day: store_index indexes into
+    stores and seconds is the offset from that day's midnight, sorted.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    num_stores = len(stores)
+    
+    base_rates = np.array([STORE_TRAFFIC[store["type"]] for store in stores], dtype=float) * traffic_scale
+    hot_factor = rng.lognormal(-traffic_skew ** 2 / 2, traffic_skew, num_stores)
+    hour_profile = np.array(HOUR_WEIGHTS) / sum(HOUR_WEIGHTS)
+    intensity = np.outer(base_rates * hot_factor, hour_profile).ravel()  # store-major, 24 hours each
+    cells = np.arange(num_stores * 24, dtype=np.int32 if num_stores * 24 < 2 ** 31 else np.int64)
+    
+    for day in range(days):
+        counts = rng.poisson(intensity)
+        cell = np.repeat(cells, counts)
+        seconds = (cell % 24) * 3600 + rng.integers(0, 3600, cell.size, dtype=np.int32)
+        order = np.argsort(seconds)  # Ties are random anyway, so no need for a stable sort
+        yield day, cell[order] // 24, seconds[order]
+
+def iter_store_transactions(stores, customers, days=180, rng=None, traffic_skew=0.8, traffic_scale=1.0):
+    """Yield (transaction, items) pairs driven by per-store arrivals over the last days"""
+    brands = list(BRANDS_PORTFOLIO.keys())
+    start_date = datetime.combine(datetime.now().date() - timedelta(days=days), datetime.min.time())
+    
+    index = 0
+    for day, store_index, seconds in simulate_store_arrivals(stores, days, rng, traffic_skew, traffic_scale):
+        day_start = start_date + timedelta(days=day)
+        for store_idx, offset in zip(store_index.tolist(), seconds.tolist()):
+            transaction_date = day_start + timedelta(seconds=offset)
+            yield build_transaction(index, stores[store_idx], transaction_date, customers, brands)
+            index += 1
+
+def generate_transactions(num_transactions=5000):
+    """Generate realistic FMCG transactions with regional distribution"""
+    
+    customers = generate_customer_names()
+    stores = generate_stores()
+    
+    transactions = []
+    transaction_items = []
+    
+    for transaction, items in iter_transactions(num_transactions, customers, stores):
+        transactions.append(transaction)
+        transaction_items.extend(items)
     
     return transactions, transaction_items, stores
 
@@ -293,10 +392,8 @@ def generate_products():
     products = []
     
     for brand, info in BRANDS_PORTFOLIO.items():
-        product_id = f"prod_{hash(brand) % 1000:03d}"
-        
         products.append({
-            "id": product_id,
+            "id": product_id_for(brand),
             "name": brand,
             "category": info["category"],
             "unit_cost": info["unit_cost"],
@@ -6,8 +6,10 @@ Generates 5,000 synthetic transactions with real-world noise and regional skews
 
 import random
 import uuid
+import zlib
 import json
 from datetime import datetime, timedelta
+from itertools import accumulate
 import numpy as np
 
 # 1. Define Philippine regions with realistic weights (mega cities heavily weighted)
@@ -223,37 +225,73 @@ customer_segments = {
     "bulk_buyer": 0.2        # Larger quantities, less frequent
 }
 
-# 5. Generate the dataset
-def generate_fmcg_dataset(num_transactions=5000):
-    """Generate realistic FMCG transaction dataset"""
+def product_id_for(brand):
+    """Product ID shared by transaction items and the product catalog
     
-    print("🏭 Generating comprehensive FMCG dataset...")
-    print(f"📊 Target: {num_transactions:,} transactions")
-    print("🏙️ Weighted toward mega cities (NCR, CALABARZON, Central Luzon)")
-    print()
-    
-    transactions = []
-    transaction_items = []
-    customers = set()
-    stores = set()
+    crc32 rather than hash(), which is salted per process (PYTHONHASHSEED).
+    """
+    return f"prod_{zlib.crc32(brand.encode('utf-8')) % 10000:04d}"
+
+def generate_products(shares=None):
+    """Generate product catalog from brands data"""
+    shares = shares if shares is not None else market_shares
+    return [
+        {
+            "id": product_id_for(brand),
+            "name": brand,
+            "category": info["category"],
+            "unit_cost": info["unit_cost"],
+            "base_price": info["base_price"],
+            "market_tier": info["market_tier"],
+            "market_share": shares[brand],
+            "is_fmcg": True,
+            "brand": brand.split()[0],  # First word as brand
+        }
+        for brand, info in brands_data.items()
+    ]
+
+def build_sampling_tables(region_mix=None, store_type_mix=None, shares=None):
+    """Precompute the sampling tables once, applying any weight overrides
+    
+    region_mix and store_type_mix map names to replacement weights; names
+    not mentioned keep their default weight. shares replaces market_shares.
+    """
+    region_table = dict(regions)
+    region_table.update(region_mix or {})
+    store_type_table = dict(zip(store_types, store_type_weights))
+    store_type_table.update(store_type_mix or {})
+    shares = shares if shares is not None else market_shares
+    
+    return {
+        "region_names": list(region_table.keys()),
+        "region_cum_weights": list(accumulate(region_table.values())),
+        "store_types": list(store_type_table.keys()),
+        "store_type_cum_weights": list(accumulate(store_type_table.values())),
+        "segments": list(customer_segments.keys()),
+        "segment_cum_weights": list(accumulate(customer_segments.values())),
+        "brand_cum_weights": list(accumulate(shares[b] for b in brands))
+    }
+
+# 5. Generate the dataset
+def iter_fmcg_transactions(num_transactions=5000, tables=None):
+    """Yield (transaction, items) pairs one transaction at a time"""
+    tables = tables if tables is not None else build_sampling_tables()
     
     # Generate customer pool
     customer_pool = [f"cust_{i:05d}" for i in range(1, 2001)]  # 2000 customers
     
     for i in range(num_transactions):
         # Select region with weights
-        region = random.choices(region_names, weights=region_weights)[0]
+        region = random.choices(tables["region_names"], cum_weights=tables["region_cum_weights"])[0]
         
         # Select store type
-        store_type = random.choices(store_types, weights=store_type_weights)[0]
+        store_type = random.choices(tables["store_types"], cum_weights=tables["store_type_cum_weights"])[0]
         
         # Generate store ID
         store_id = f"store_{region.replace(' ', '_').lower()}_{random.randint(1, 100):03d}"
-        stores.add(store_id)
         
         # Select customer segment and behavior
-        segment = random.choices(list(customer_segments.keys()), 
-                               weights=list(customer_segments.values()))[0]
+        segment = random.choices(tables["segments"], cum_weights=tables["segment_cum_weights"])[0]
         
         # Customer selection (repeat customers more likely in frequent_buyer segment)
         if segment == "frequent_buyer" and random.random() < 0.7:
@@ -261,8 +299,6 @@ def generate_fmcg_dataset(num_transactions=5000):
         else:
             customer_id = random.choice(customer_pool)
         
-        customers.add(customer_id)
-        
         # Transaction timing
         transaction_date = generate_realistic_timestamp()
         transaction_id = f"txn_{i+1:06d}"
@@ -276,9 +312,7 @@ def generate_fmcg_dataset(num_transactions=5000):
             num_items = random.choices([1, 2, 3], weights=[50, 35, 15])[0]
         
         # Select brands for this transaction
-        selected_brands = random.choices(brands, 
-                                       weights=[market_shares[b] for b in brands], 
-                                       k=num_items)
+        selected_brands = random.choices(brands, cum_weights=tables["brand_cum_weights"], k=num_items)
         
         # Remove duplicates while preserving some
         unique_brands = []
@@ -287,6 +321,7 @@ def generate_fmcg_dataset(num_transactions=5000):
                 unique_brands.append(brand)
         
         transaction_total = 0
+        items = []
         
         # Generate items for this transaction
         for j, brand in enumerate(unique_brands):
@@ -307,13 +342,10 @@ def generate_fmcg_dataset(num_transactions=5000):
             item_total = unit_price * quantity
             transaction_total += item_total
             
-            # Generate product ID
-            product_id = f"prod_{hash(brand) % 10000:04d}"
-            
-            transaction_items.append({
+            items.append({
                 "id": f"item_{i+1:06d}_{j+1:02d}",
                 "transaction_id": transaction_id,
-                "product_id": product_id,
+                "product_id": product_id_for(brand),
                 "product_name": brand,
                 "category": brand_info["category"],
                 "unit_price": unit_price,
@@ -332,7 +364,7 @@ def generate_fmcg_dataset(num_transactions=5000):
             weights=payment_weights
         )[0]
         
-        transactions.append({
+        transaction = {
             "id": transaction_id,
             "customer_id": customer_id,
             "store_id": store_id,
@@ -342,7 +374,28 @@ def generate_fmcg_dataset(num_transactions=5000):
             "total_amount": round(transaction_total, 2),
             "payment_method": payment_method,
             "customer_segment": segment
-        })
+        }
+        
+        yield transaction, items
+
+def generate_fmcg_dataset(num_transactions=5000):
+    """Generate realistic FMCG transaction dataset"""
+    
+    print("🏭 Generating comprehensive FMCG dataset...")
+    print(f"📊 Target: {num_transactions:,} transactions")
+    print("🏙️ Weighted toward mega cities (NCR, CALABARZON, Central Luzon)")
+    print()
+    
+    transactions = []
+    transaction_items = []
+    customers = set()
+    stores = set()
+    
+    for i, (transaction, items) in enumerate(iter_fmcg_transactions(num_transactions)):
+        transactions.append(transaction)
+        transaction_items.extend(items)
+        customers.add(transaction["customer_id"])
+        stores.add(transaction["store_id"])
         
         if (i + 1) % 1000 == 0:
             print(f"✅ Generated {i+1:,} transactions...")
@@ -412,6 +465,7 @@ if __name__ == "__main__":
         },
         "transactions": transactions,
         "transaction_items": transaction_items,
+        "products": generate_products(),
         "brands_portfolio": brands_data,
         "market_shares": market_shares
     }
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Scout Analytics - Multi-Scenario Dataset Runner
+Generates several what-if variants of the FMCG dataset in one process (or a
+process pool), building the catalog and unchanged sampling tables only once.
+Per-transaction generation dominates each scenario; most of the saving over
+separate runs is interpreter start-up and imports, not the shared tables.
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+
+import generate_comprehensive_fmcg_dataset as comprehensive
+import generate_realistic_fmcg_dataset as realistic
+from fmcg_sql_emitter import FORMATS, write_seed_file
+
+OUTPUT_FORMATS = ("json",) + FORMATS
+
+# Scenario fields and their defaults; regions / store_types are partial weight overrides
+SCENARIO_DEFAULTS = {
+    "generator": "comprehensive",
+    "transactions": 5000,
+    "seed": 42,
+    "regions": None,
+    "store_types": None,
+    "market_share_seed": None,
+}
+
+# Scenarios name store types in the comprehensive generator's (schema) vocabulary;
+# the realistic generator's equivalents, which has no mini marts or hypermarkets
+REALISTIC_STORE_TYPES = {
+    "Sari-Sari Store": "sari-sari",
+    "Convenience Store": "convenience",
+    "Grocery Store": "grocery",
+    "Supermarket": "supermarket",
+}
+
+STORE_TYPE_NAMES = {
+    "comprehensive": list(comprehensive.STORE_TYPES),
+    "realistic": list(REALISTIC_STORE_TYPES),
+}
+
+
+def _check_weights(name, field, weights, allowed):
+    if not isinstance(weights, dict):
+        raise ValueError(f"Scenario {name!r}: {field} must map names to weights")
+    unknown = sorted(set(weights) - set(allowed))
+    if unknown:
+        raise ValueError(f"Scenario {name!r}: unknown {field} {unknown}; expected some of {allowed}")
+    for key, weight in weights.items():
+        if isinstance(weight, bool) or not isinstance(weight, (int, float)) or weight < 0:
+            raise ValueError(f"Scenario {name!r}: {field} weight for {key!r} must be a non-negative number")
+
+
+def validate_scenario(scenario):
+    """Scenario with defaults applied; raises ValueError naming the scenario on bad fields"""
+    name = scenario.get("name")
+    if not isinstance(name, str) or not name:
+        raise ValueError(f"Scenario without a name: {scenario!r}")
+    unknown = sorted(set(scenario) - set(SCENARIO_DEFAULTS) - {"name"})
+    if unknown:
+        raise ValueError(f"Scenario {name!r}: unknown field(s) {unknown}; expected some of "
+                         f"{['name'] + list(SCENARIO_DEFAULTS)}")
+
+    scenario = {**SCENARIO_DEFAULTS, **scenario}
+    generator = scenario["generator"]
+    if generator not in STORE_TYPE_NAMES:
+        raise ValueError(f"Scenario {name!r}: unknown generator {generator!r}; "
+                         f"expected one of {sorted(STORE_TYPE_NAMES)}")
+    transactions = scenario["transactions"]
+    if isinstance(transactions, bool) or not isinstance(transactions, int) or transactions < 1:
+        raise ValueError(f"Scenario {name!r}: transactions must be a positive integer")
+    if scenario["regions"] is not None:
+        _check_weights(name, "regions", scenario["regions"], list(comprehensive.REGIONS))
+    if scenario["store_types"] is not None:
+        _check_weights(name, "store_types", scenario["store_types"], STORE_TYPE_NAMES[generator])
+    if scenario["market_share_seed"] is not None and generator != "realistic":
+        raise ValueError(f"Scenario {name!r}: market_share_seed only applies to the realistic generator")
+    return scenario
+
+
+def _freeze(mapping):
+    """Hashable memo key for an optional override dict"""
+    return tuple(sorted(mapping.items())) if mapping else None
+
+
+class ScenarioContext:
+    """Catalog arrays and sampling tables shared by every scenario in a process.
+
+    Each artifact is built once per distinct override that affects it, so
+    scenarios that only change market shares reuse the same stores and region
+    tables, and scenarios that only change regions reuse the market shares.
+    Shared artifacts are drawn under base_seed, independent of scenario order.
+    """
+
+    def __init__(self, base_seed=42):
+        self.base_seed = base_seed
+        self.memo = {}
+        self.builds = 0
+
+    def _get(self, key, build):
+        if key not in self.memo:
+            self.memo[key] = build()
+            self.builds += 1
+        return self.memo[key]
+
+    def _seeded(self, build, seed=None):
+        random.seed(self.base_seed if seed is None else seed)
+        np.random.seed(self.base_seed if seed is None else seed)
+        return build()
+
+    def customers(self):
+        return self._get(("customers",), lambda: self._seeded(comprehensive.generate_customer_names))
+
+    def comprehensive_products(self):
+        return self._get(("products", "comprehensive"), comprehensive.generate_products)
+
+    def stores(self, regions, store_types):
+        def build():
+            region_table = {**comprehensive.REGIONS, **(regions or {})}
+            store_type_table = {**comprehensive.STORE_TYPES, **(store_types or {})}
+            return self._seeded(lambda: comprehensive.generate_stores(50, region_table, store_type_table))
+        return self._get(("stores", _freeze(regions), _freeze(store_types)), build)
+
+    def comprehensive_tables(self, regions, store_types):
+        def build():
+            region_table = {**comprehensive.REGIONS, **(regions or {})}
+            return comprehensive.build_sampling_tables(self.stores(regions, store_types), region_table)
+        return self._get(("tables", "comprehensive", _freeze(regions), _freeze(store_types)), build)
+
+    def market_shares(self, share_seed):
+        return self._get(("shares", share_seed),
+                         lambda: self._seeded(realistic.generate_market_shares, share_seed))
+
+    def realistic_products(self, share_seed):
+        return self._get(("products", "realistic", share_seed),
+                         lambda: realistic.generate_products(self.market_shares(share_seed)))
+
+    def realistic_tables(self, regions, store_types, share_seed):
+        def build():
+            return realistic.build_sampling_tables(regions, store_types, self.market_shares(share_seed))
+        return self._get(("tables", "realistic", _freeze(regions), _freeze(store_types), share_seed), build)
+
+
+def _scenario_stream(context, scenario):
+    """(pairs, products, stores) for a scenario, with shared artifacts fetched first"""
+    n = scenario["transactions"]
+    if scenario["generator"] == "comprehensive":
+        customers = context.customers()
+        stores = context.stores(scenario["regions"], scenario["store_types"])
+        tables = context.comprehensive_tables(scenario["regions"], scenario["store_types"])
+        products = context.comprehensive_products()
+        # Seed after fetching shared artifacts, which reseed while being built
+        random.seed(scenario["seed"])
+        np.random.seed(scenario["seed"])
+        return comprehensive.iter_transactions(n, customers, stores, tables), products, stores
+
+    store_types = scenario["store_types"]
+    if store_types:
+        store_types = {REALISTIC_STORE_TYPES[store_type]: weight for store_type, weight in store_types.items()}
+    tables = context.realistic_tables(scenario["regions"], store_types, scenario["market_share_seed"])
+    products = context.realistic_products(scenario["market_share_seed"])
+    random.seed(scenario["seed"])
+    np.random.seed(scenario["seed"])
+    return realistic.iter_fmcg_transactions(n, tables), products, None
+
+
+def run_scenario(context, scenario, output_dir, fmt="json"):
+    """Generate one scenario into its own output file and return a summary"""
+    scenario = validate_scenario(scenario)
+    started = time.perf_counter()
+    pairs, products, stores = _scenario_stream(context, scenario)
+    path = os.path.join(output_dir, f"{scenario['name']}.{'json' if fmt == 'json' else 'sql'}")
+
+    if fmt == "json":
+        transactions = []
+        transaction_items = []
+        for transaction, items in pairs:
+            transactions.append(transaction)
+            transaction_items.extend(items)
+        dataset = {
+            "metadata": {
+                "generated_at": datetime.now().isoformat(),
+                "scenario": scenario,
+                "total_transactions": len(transactions),
+                "total_items": len(transaction_items),
+            },
+            "transactions": transactions,
+            "transaction_items": transaction_items,
+            "products": products,
+        }
+        if stores is not None:
+            dataset["stores"] = stores
+        with open(path, "w") as f:
+            json.dump(dataset, f, indent=2, default=str)
+        count = len(transactions)
+    else:
+        count = write_seed_file(path, pairs, products, stores, fmt)["transactions"]
+
+    return {
+        "name": scenario["name"],
+        "path": path,
+        "transactions": count,
+        "seconds": time.perf_counter() - started,
+    }
+
+
+_WORKER_CONTEXT = None
+
+
+def _init_worker(base_seed):
+    global _WORKER_CONTEXT
+    _WORKER_CONTEXT = ScenarioContext(base_seed)
+
+
+def _run_in_worker(scenario, output_dir, fmt):
+    return run_scenario(_WORKER_CONTEXT, scenario, output_dir, fmt)
+
+
+def run_scenarios(scenarios, output_dir, fmt="json", workers=1, base_seed=42):
+    """Run every scenario, sharing one context per process; returns summaries in input order"""
+    scenarios = [validate_scenario(scenario) for scenario in scenarios]  # Fail before any work starts
+    names = [scenario["name"] for scenario in scenarios]
+    if len(set(names)) != len(names):
+        raise ValueError("Scenario names must be unique; they name the output files")
+    os.makedirs(output_dir, exist_ok=True)
+
+    if workers <= 1:
+        context = ScenarioContext(base_seed)
+        return [run_scenario(context, scenario, output_dir, fmt) for scenario in scenarios]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(base_seed,)) as pool:
+        futures = [pool.submit(_run_in_worker, scenario, output_dir, fmt) for scenario in scenarios]
+        return [future.result() for future in futures]
+
+
+def main():
+    """Run a list of scenarios from a JSON file"""
+    parser = argparse.ArgumentParser(description="Scout Analytics multi-scenario dataset runner")
+    parser.add_argument("scenarios", help="JSON file with a list of scenario overrides")
+    parser.add_argument("--output-dir", default="scenario_outputs")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="json")
+    parser.add_argument("--workers", type=int, default=1, help="Processes; each builds the shared tables once")
+    parser.add_argument("--base-seed", type=int, default=42, help="Seed for the shared catalog and store universe")
+    args = parser.parse_args()
+
+    with open(args.scenarios) as f:
+        scenarios = json.load(f)
+
+    print(f"🧪 Running {len(scenarios)} scenario(s) with {args.workers} worker(s)...")
+    started = time.perf_counter()
+    try:
+        summaries = run_scenarios(scenarios, args.output_dir, args.format, args.workers, args.base_seed)
+    except ValueError as e:
+        parser.error(str(e))
+    elapsed = time.perf_counter() - started
+
+    for summary in summaries:
+        print(f"   {summary['name']}: {summary['transactions']:,} transactions "
+              f"in {summary['seconds']:.1f}s -> {summary['path']}")
+    print(f"✅ All scenarios done in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+Scout Analytics - Edge Device Telemetry Simulator
+Registers the in-store devices of a generate_stores() universe, then streams
+device_health, edge_logs and product_detections events at configurable rates
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from fmcg_sql_emitter import SqlSeedWriter
+from generate_comprehensive_fmcg_dataset import BRANDS_PORTFOLIO, generate_stores
+
+# Edge devices installed per store, by store type
+DEVICES_PER_STORE = {
+    "Sari-Sari Store": 1,
+    "Mini Mart": 1,
+    "Grocery Store": 2,
+    "Supermarket": 4,
+    "Convenience Store": 2,
+    "Hypermarket": 8
+}
+
+FIRMWARE_VERSIONS = ["1.0.0", "1.1.0", "1.2.3", "2.0.1"]
+LOG_LEVELS = ["DEBUG", "INFO", "WARN", "ERROR", "FATAL"]
+LOG_LEVEL_WEIGHTS = [20, 65, 10, 4, 1]
+LOG_COMPONENTS = ["camera", "audio", "inference", "uploader", "system"]
+
+# Interval between producer ticks; each tick emits a Poisson number of events
+TICK_SECONDS = 0.02
+
+
+def build_devices(stores):
+    """Device registry rows (devices table) for a store universe.
+
+    store_id is the integer stores.id that SqlSeedWriter.write_stores() gives
+    the same store list: its 1-based position.
+    """
+    devices = []
+    for store_id, store in enumerate(stores, start=1):
+        for n in range(DEVICES_PER_STORE[store["type"]]):
+            devices.append({
+                "device_id": f"Pi5-{store['id']}-{n + 1:02d}",
+                "device_type": "RaspberryPi5",
+                "firmware_version": random.choice(FIRMWARE_VERSIONS),
+                "store_id": store_id,
+                "status": "active",
+                "location": f"{store['name']}, {store['barangay']}, {store['region']}",
+            })
+    return devices
+
+
+def health_event(device, timestamp):
+    """device_health row"""
+    return {
+        "device_id": device["device_id"],
+        "timestamp": timestamp,
+        "cpu_usage": round(random.uniform(5, 95), 1),
+        "memory_usage": round(random.uniform(20, 90), 1),
+        "disk_usage": round(random.uniform(10, 80), 1),
+        "temperature": round(random.gauss(55, 8), 1),
+        "uptime_seconds": random.randint(60, 30 * 86400),
+        "network_connected": random.random() > 0.02,
+        "battery_level": None,
+    }
+
+
+def log_event(device, timestamp):
+    """edge_logs row"""
+    level = random.choices(LOG_LEVELS, weights=LOG_LEVEL_WEIGHTS)[0]
+    component = random.choice(LOG_COMPONENTS)
+    return {
+        "device_id": device["device_id"],
+        "log_level": level,
+        "message": f"{component} {level.lower()} on {device['device_id']}",
+        "timestamp": timestamp,
+        "component": component,
+        "error_code": f"E{random.randint(100, 999)}" if level in ("ERROR", "FATAL") else None,
+    }
+
+
+def detection_event(device, timestamp, brands):
+    """product_detections row"""
+    return {
+        "device_id": device["device_id"],
+        "store_id": device["store_id"],
+        "detected_at": timestamp,
+        "brand_detected": random.choice(brands),
+        "confidence_score": round(random.uniform(0.55, 0.99), 3),
+        "customer_age": random.randint(16, 70),
+        "customer_gender": random.choices(["Male", "Female", "Other"], weights=[48, 48, 4])[0],
+        "image_path": None,
+    }
+
+
+class TelemetryStats:
+    """Throughput and emit-to-sink latency counters"""
+
+    def __init__(self, latency_samples=10000):
+        self.started = time.perf_counter()
+        self.emitted = {}
+        self.delivered = {}
+        self.latencies = []
+        self.latency_samples = latency_samples
+        self.latency_seen = 0
+        self.failed = 0
+
+    def record_emit(self, table, count):
+        self.emitted[table] = self.emitted.get(table, 0) + count
+
+    def record_delivery(self, table, count, emitted_at):
+        self.delivered[table] = self.delivered.get(table, 0) + count
+        # Reservoir of batch latencies keeps percentile memory bounded
+        latency = time.perf_counter() - emitted_at
+        self.latency_seen += 1
+        if len(self.latencies) < self.latency_samples:
+            self.latencies.append(latency)
+        else:
+            slot = random.randrange(self.latency_seen)
+            if slot < self.latency_samples:
+                self.latencies[slot] = latency
+
+    def record_failure(self, count):
+        self.failed += count
+
+    def snapshot(self):
+        elapsed = time.perf_counter() - self.started
+        delivered = sum(self.delivered.values())
+        latencies = sorted(self.latencies)
+
+        def percentile(p):
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000 if latencies else 0.0
+
+        return {
+            "elapsed_seconds": elapsed,
+            "emitted": dict(self.emitted),
+            "delivered": dict(self.delivered),
+            "failed": self.failed,
+            "events_per_second": delivered / elapsed if elapsed else 0.0,
+            "latency_ms": {"p50": percentile(0.50), "p95": percentile(0.95), "p99": percentile(0.99)},
+        }
+
+
+class FileSink:
+    """Appends events as JSON lines: {"table": ..., "row": ...}"""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = None
+
+    async def open(self):
+        self.file = open(self.path, "w", encoding="utf-8")
+
+    async def send(self, table, rows):
+        self.file.write("".join(json.dumps({"table": table, "row": row}) + "\n" for row in rows))
+
+    async def close(self):
+        self.file.close()
+
+
+class QueueSink:
+    """Hands batches to an in-process asyncio.Queue for a downstream consumer"""
+
+    def __init__(self, queue=None, drain=False):
+        self.queue = queue if queue is not None else asyncio.Queue(maxsize=1000)
+        self.drain = drain
+        self.drain_task = None
+
+    async def open(self):
+        # Standalone runs have no downstream reader, so discard batches as they arrive
+        if self.drain:
+            self.drain_task = asyncio.create_task(self._drain())
+
+    async def _drain(self):
+        while True:
+            await self.queue.get()
+
+    async def send(self, table, rows):
+        await self.queue.put((table, rows))
+
+    async def close(self):
+        if self.drain_task:
+            self.drain_task.cancel()
+
+
+class HttpSink:
+    """POSTs JSON batches over a small pool of keep-alive HTTP/1.1 connections"""
+
+    def __init__(self, url, connections=4):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.path = parts.path or "/"
+        self.connections = connections
+        self.pool = asyncio.Queue()
+
+    async def open(self):
+        for _ in range(self.connections):
+            self.pool.put_nowait(await asyncio.open_connection(self.host, self.port))
+
+    async def _exchange(self, connection, request):
+        """Send one request on a connection and return the response status line"""
+        reader, writer = connection
+        writer.write(request)
+        await writer.drain()
+        status = await reader.readline()
+        if not status:
+            raise ConnectionResetError("Sink closed the connection")
+        length = 0
+        while True:
+            header = await reader.readline()
+            if header in (b"\r\n", b""):
+                break
+            name, _, value = header.decode("latin-1").partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value)
+        if length:
+            await reader.readexactly(length)
+        return status
+
+    async def send(self, table, rows):
+        body = json.dumps({"table": table, "rows": rows}).encode("utf-8")
+        request = (f"POST {self.path} HTTP/1.1\r\n"
+                   f"Host: {self.host}:{self.port}\r\n"
+                   "Content-Type: application/json\r\n"
+                   f"Content-Length: {len(body)}\r\n\r\n").encode("ascii") + body
+
+        # A None slot is a connection dropped after an error; reopen it on use
+        connection = await self.pool.get()
+        try:
+            if connection is None:
+                connection = await asyncio.open_connection(self.host, self.port)
+            status = await self._exchange(connection, request)
+        except BaseException:
+            # The stream may be mid-response, so never reuse it
+            if connection is not None:
+                connection[1].close()
+            connection = None
+            raise
+        finally:
+            self.pool.put_nowait(connection)
+
+        parts = status.split()
+        if len(parts) < 2 or not parts[1].startswith(b"2"):
+            raise RuntimeError(f"Sink rejected batch: {status.decode('latin-1').strip()}")
+
+    async def close(self):
+        while not self.pool.empty():
+            connection = self.pool.get_nowait()
+            if connection is not None:
+                connection[1].close()
+                await connection[1].wait_closed()
+
+
+def make_sink(spec, connections=4):
+    """Sink from a spec: a file path, 'queue', or an http:// URL"""
+    if spec == "queue":
+        return QueueSink(drain=True)
+    if spec.startswith("http://"):
+        return HttpSink(spec, connections)
+    return FileSink(spec)
+
+
+async def serve_http_sink(port):
+    """Minimal local ingestion endpoint that accepts and counts POSTed batches"""
+    received = {"batches": 0, "events": 0}
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                length = 0
+                while True:
+                    header = await reader.readline()
+                    if header in (b"\r\n", b""):
+                        break
+                    name, _, value = header.decode("latin-1").partition(":")
+                    if name.strip().lower() == "content-length":
+                        length = int(value)
+                body = await reader.readexactly(length) if length else b""
+                received["batches"] += 1
+                received["events"] += len(json.loads(body)["rows"]) if body else 0
+                writer.write(b"HTTP/1.1 204 No Content\r\nContent-Length: 0\r\n\r\n")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", port)
+    return server, received
+
+
+async def produce(devices, rates, queue, stats, stop_at, seed):
+    """Emit Poisson-distributed batches for a shard of devices until stop_at"""
+    rng = np.random.default_rng(seed)
+    brands = list(BRANDS_PORTFOLIO.keys())
+    builders = {
+        "device_health": health_event,
+        "edge_logs": log_event,
+        "product_detections": lambda device, timestamp: detection_event(device, timestamp, brands),
+    }
+    shard_rates = {table: rate * len(devices) for table, rate in rates.items() if rate > 0}
+
+    last = time.perf_counter()
+    while last < stop_at:
+        await asyncio.sleep(TICK_SECONDS)
+        now = time.perf_counter()
+        # Size each batch by the time actually elapsed, so a late tick catches up
+        elapsed, last = now - last, now
+        timestamp = datetime.now(timezone.utc).isoformat()
+        for table, rate in shard_rates.items():
+            count = rng.poisson(rate * elapsed)
+            if not count:
+                continue
+            build = builders[table]
+            rows = [build(devices[i], timestamp) for i in rng.integers(0, len(devices), count).tolist()]
+            stats.record_emit(table, count)
+            await queue.put((table, rows, now))
+
+
+async def consume(queue, sink, stats):
+    """Deliver batches to the sink, recording emit-to-delivery latency"""
+    while True:
+        table, rows, emitted_at = await queue.get()
+        try:
+            await sink.send(table, rows)
+            stats.record_delivery(table, len(rows), emitted_at)
+        except (OSError, RuntimeError, asyncio.IncompleteReadError) as e:
+            stats.record_failure(len(rows))
+            print(f"⚠️ Failed to deliver {len(rows)} {table} events: {e}")
+        finally:
+            queue.task_done()
+
+
+async def report(stats, interval=1.0):
+    """Print a throughput line every interval seconds"""
+    while True:
+        await asyncio.sleep(interval)
+        snap = stats.snapshot()
+        print(f"   {snap['elapsed_seconds']:6.1f}s  {sum(snap['delivered'].values()):>10,} events  "
+              f"{snap['events_per_second']:>9,.0f}/s  p95 {snap['latency_ms']['p95']:.1f} ms")
+
+
+async def run_simulation(devices, sink, rates, duration=10.0, producers=8, consumers=4,
+                         queue_size=1000, seed=None, progress=True):
+    """Run producers and consumers for duration seconds and return the final stats"""
+    stats = TelemetryStats()
+    queue = asyncio.Queue(maxsize=queue_size)  # Bounded: a slow sink throttles producers
+    await sink.open()
+    # Register devices first; every telemetry table references devices(device_id)
+    await sink.send("devices", devices)
+
+    stop_at = time.perf_counter() + duration
+    shards = [devices[i::producers] for i in range(producers)]
+    producer_tasks = [
+        asyncio.create_task(produce(shard, rates, queue, stats, stop_at, None if seed is None else seed + i))
+        for i, shard in enumerate(shards) if shard
+    ]
+    consumer_tasks = [asyncio.create_task(consume(queue, sink, stats)) for _ in range(consumers)]
+    reporter = asyncio.create_task(report(stats)) if progress else None
+
+    try:
+        await asyncio.gather(*producer_tasks)
+        await queue.join()
+    finally:
+        for task in consumer_tasks + ([reporter] if reporter else []):
+            task.cancel()
+        await sink.close()
+
+    return stats.snapshot()
+
+
+def write_stores_seed(path, stores):
+    """SQL seed for the store universe, so devices.store_id resolves to stores(id)"""
+    with open(path, "w", encoding="utf-8") as out:
+        writer = SqlSeedWriter(out)
+        writer.write_header()
+        writer.write_stores(stores)
+        writer.write_footer()
+
+
+async def _main(args):
+    random.seed(args.seed)
+    stores = generate_stores(args.store_scale)
+    devices = build_devices(stores)
+    if args.stores_seed:
+        write_stores_seed(args.stores_seed, stores)
+    rates = {
+        "device_health": args.health_rate,
+        "edge_logs": args.log_rate,
+        "product_detections": args.detection_rate,
+    }
+    target = len(devices) * sum(rates.values())
+
+    print("📡 Simulating edge device telemetry...")
+    print(f"   Stores: {len(stores):,}  Devices: {len(devices):,}  Target: {target:,.0f} events/s")
+    print(f"   Sink: {args.sink}")
+    if args.stores_seed:
+        print(f"   Stores seed: {args.stores_seed}")
+    print()
+
+    server = None
+    if args.serve_http:
+        server, received = await serve_http_sink(args.serve_http)
+
+    sink = make_sink(args.sink, args.consumers)
+    snap = await run_simulation(devices, sink, rates, args.duration, args.producers, args.consumers,
+                                args.queue_size, args.seed)
+
+    if server:
+        server.close()
+        await server.wait_closed()
+
+    print()
+    print("📈 Telemetry Statistics:")
+    for table, count in sorted(snap["delivered"].items()):
+        print(f"   {table}: {count:,} events")
+    if snap["failed"]:
+        print(f"   Failed: {snap['failed']:,} events")
+    print(f"   Throughput: {snap['events_per_second']:,.0f} events/s")
+    latency = snap["latency_ms"]
+    print(f"   Latency: p50 {latency['p50']:.1f} ms, p95 {latency['p95']:.1f} ms, p99 {latency['p99']:.1f} ms")
+    if server:
+        print(f"   Local HTTP sink received {received['events']:,} events in {received['batches']:,} batches")
+
+
+def main():
+    """Run the telemetry simulator from the command line"""
+    parser = argparse.ArgumentParser(description="Scout Analytics edge device telemetry simulator")
+    parser.add_argument("--sink", default="device_telemetry.jsonl",
+                        help="JSON lines file path, 'queue', or http://host:port/path")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run")
+    parser.add_argument("--store-scale", type=int, default=2000, help="Approximate number of stores")
+    parser.add_argument("--health-rate", type=float, default=0.5, help="Health events per device per second")
+    parser.add_argument("--log-rate", type=float, default=2.0, help="Log events per device per second")
+    parser.add_argument("--detection-rate", type=float, default=4.0, help="Detections per device per second")
+    parser.add_argument("--producers", type=int, default=8)
+    parser.add_argument("--consumers", type=int, default=4, help="Concurrent sink writers / HTTP connections")
+    parser.add_argument("--queue-size", type=int, default=1000, help="Batches buffered before producers block")
+    parser.add_argument("--serve-http", type=int, metavar="PORT", help="Also run a local HTTP sink on PORT")
+    parser.add_argument("--stores-seed", metavar="PATH",
+                        help="Also write the simulated stores as a SQL seed, to load before the telemetry")
+    parser.add_argument("--seed", type=int, default=42)
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Scout Analytics - FMCG Dataset Integrity Validator
+Checks referential and arithmetic invariants of generated datasets one
+transaction at a time, inline during generation or standalone on output files
+"""
+
+import argparse
+import collections
+import itertools
+import json
+import os
+import re
+import sys
+import tempfile
+
+# Rounding slack per amount: items and totals are each rounded to centavos
+ROUNDING_TOLERANCE = 0.005
+
+# Item groups read ahead when joining a file's items to its transactions
+LOOKAHEAD_GROUPS = 16
+
+
+class DatasetValidator:
+    """Streaming validator fed one transaction (with its items) at a time.
+
+    Memory is bounded by the product catalog, the store list, the customer
+    ID space and ``max_violations`` - never by the number of transactions.
+    """
+
+    def __init__(self, products=None, stores=None, max_violations=1000):
+        self.max_violations = max_violations
+        self.violations = []
+        self.violation_counts = {}
+        self.transaction_rows = 0
+        self.item_rows = 0
+        self.products = {}
+        self.store_ids = {store["id"] for store in stores} if stores is not None else None
+        self.customer_names = {}
+
+        # Index the catalog, flagging ID buckets shared by different products
+        self.check_products = products is not None
+        for row, product in enumerate(products or []):
+            existing = self.products.get(product["id"])
+            if existing is not None and existing != product["name"]:
+                self._report("product_id_collision", "products", row, product["id"],
+                             f"{product['name']!r} shares ID with {existing!r}")
+                continue
+            self.products[product["id"]] = product["name"]
+
+    def _report(self, kind, table, row, key, detail):
+        self.violation_counts[kind] = self.violation_counts.get(kind, 0) + 1
+        if len(self.violations) < self.max_violations:
+            self.violations.append({
+                "kind": kind,
+                "table": table,
+                "row": row,
+                "key": key,
+                "detail": detail,
+            })
+
+    def check(self, transaction, items):
+        """Validate one transaction and the items that belong to it"""
+        txn_row = self.transaction_rows
+        self.transaction_rows += 1
+
+        if not items:
+            self._report("empty_transaction", "transactions", txn_row, transaction["id"],
+                         "transaction has no items")
+
+        items_total = 0.0
+        for item in items:
+            item_row = self.item_rows
+            self.item_rows += 1
+            items_total += item["total_amount"]
+
+            if item["transaction_id"] != transaction["id"]:
+                self._report("item_transaction_mismatch", "transaction_items", item_row, item["id"],
+                             f"belongs to {item['transaction_id']!r}, not {transaction['id']!r}")
+
+            line_total = item["unit_price"] * item["quantity"]
+            if abs(line_total - item["total_amount"]) > ROUNDING_TOLERANCE:
+                self._report("item_total_mismatch", "transaction_items", item_row, item["id"],
+                             f"unit_price x quantity = {line_total:.2f}, total_amount = {item['total_amount']:.2f}")
+
+            if self.check_products:
+                name = self.products.get(item["product_id"])
+                if name is None:
+                    self._report("unknown_product", "transaction_items", item_row, item["id"],
+                                 f"product_id {item['product_id']!r} not in products")
+                elif name != item["product_name"]:
+                    self._report("product_id_collision", "transaction_items", item_row, item["id"],
+                                 f"{item['product_id']!r} is {name!r} in products, "
+                                 f"{item['product_name']!r} here")
+
+        tolerance = ROUNDING_TOLERANCE * (len(items) + 1)
+        if abs(items_total - transaction["total_amount"]) > tolerance:
+            self._report("total_mismatch", "transactions", txn_row, transaction["id"],
+                         f"total_amount = {transaction['total_amount']:.2f}, items sum to {items_total:.2f}")
+
+        if self.store_ids is not None and transaction["store_id"] not in self.store_ids:
+            self._report("unknown_store", "transactions", txn_row, transaction["id"],
+                         f"store_id {transaction['store_id']!r} not in stores")
+
+        # Only the comprehensive generator derives customer IDs from names
+        customer_name = transaction.get("customer_name")
+        if customer_name is not None:
+            existing = self.customer_names.setdefault(transaction["customer_id"], customer_name)
+            if existing != customer_name:
+                self._report("customer_id_collision", "transactions", txn_row, transaction["id"],
+                             f"{transaction['customer_id']!r} is both {existing!r} and {customer_name!r}")
+
+    def orphan_items(self, items):
+        """Report items whose transaction never appeared in the stream"""
+        for item in items:
+            self._report("orphan_item", "transaction_items", self.item_rows, item["id"],
+                         f"transaction {item['transaction_id']!r} not found")
+            self.item_rows += 1
+
+    def report(self):
+        """Summary of everything checked so far"""
+        return {
+            "ok": not self.violation_counts,
+            "transactions_checked": self.transaction_rows,
+            "items_checked": self.item_rows,
+            "violation_counts": dict(self.violation_counts),
+            "violations": list(self.violations),
+        }
+
+
+def validate_stream(pairs, validator):
+    """Pass (transaction, items) pairs through, validating each on the way"""
+    for transaction, items in pairs:
+        validator.check(transaction, items)
+        yield transaction, items
+
+
+def iter_json_array(path, key, chunk_size=1 << 20):
+    """Yield elements of the top-level array ``key`` without loading the whole file.
+
+    Reads ``chunk_size`` characters at a time and decodes one element at a
+    time, so memory stays proportional to the chunk size.
+    """
+    decoder = json.JSONDecoder()
+    marker = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+
+    with open(path, encoding="utf-8") as f:
+        buf = ""
+        while True:
+            match = marker.search(buf)
+            if match:
+                buf = buf[match.end():]
+                break
+            chunk = f.read(chunk_size)
+            if not chunk:
+                raise KeyError(f"array {key!r} not found in {path}")
+            buf = buf[-(len(key) + 64):] + chunk  # Keep the tail in case the marker straddles chunks
+
+        pos = 0
+        eof = False
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n,":
+                pos += 1
+            if pos < len(buf):
+                if buf[pos] == "]":
+                    return
+                try:
+                    element, pos = decoder.raw_decode(buf, pos)
+                    yield element
+                    continue
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+            elif eof:
+                raise ValueError(f"array {key!r} in {path} is not terminated")
+
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buf = buf[pos:] + chunk
+            pos = 0
+
+
+def optional_json_array(path, key, chunk_size=1 << 20):
+    """Load a small top-level array such as products or stores, or None if absent"""
+    try:
+        return list(iter_json_array(path, key, chunk_size))
+    except KeyError:
+        return None
+
+
+def transaction_sequence(transaction_id):
+    """Generation order of a ``txn_NNNNN`` ID"""
+    return int(transaction_id.rsplit("_", 1)[1])
+
+
+def iter_file_transactions(path, chunk_size=1 << 20, orphans=None, lookahead=LOOKAHEAD_GROUPS):
+    """Yield (transaction, items) pairs from a generator's JSON output file.
+
+    Assumes transactions and transaction_items are both in generation order,
+    as the generators write them. Item groups are joined through a window of
+    the next ``lookahead`` groups: groups ahead of a transaction's own group,
+    or sorting before it by ``txn_NNNNN`` order, can never match and are passed
+    to ``orphans`` (when given), so stray items do not derail the join for the
+    rest of the file. Groups left once transactions run out are orphans too.
+    """
+    items = iter_json_array(path, "transaction_items", chunk_size)
+    groups = ((transaction_id, list(group))
+              for transaction_id, group in itertools.groupby(items, key=lambda item: item["transaction_id"]))
+    window = collections.deque(itertools.islice(groups, lookahead))
+
+    def report(stray):
+        if orphans is not None:
+            orphans(stray)
+
+    for transaction in iter_json_array(path, "transactions", chunk_size):
+        matches = [i for i, (transaction_id, _) in enumerate(window) if transaction_id == transaction["id"]]
+        matched = []
+        if matches:
+            # Strays may also split a transaction's items; rejoin the pieces
+            for _ in range(matches[-1] + 1):
+                transaction_id, group = window.popleft()
+                if transaction_id == transaction["id"]:
+                    matched.extend(group)
+                else:
+                    report(group)
+        else:
+            sequence = transaction_sequence(transaction["id"])
+            while window and transaction_sequence(window[0][0]) <= sequence:
+                report(window.popleft()[1])
+        window.extend(itertools.islice(groups, lookahead - len(window)))
+        yield transaction, matched
+
+    for _, group in window:
+        report(group)
+    for _, group in groups:
+        report(group)
+
+
+def validate_file(path, chunk_size=1 << 20, max_violations=1000):
+    """Validate a generator's JSON output with bounded memory.
+
+    The file is read sequentially once per array: the small products and
+    stores arrays are loaded up front, then transactions and their items are
+    streamed side by side by two readers over the same file.
+    """
+    products = optional_json_array(path, "products", chunk_size)
+    stores = optional_json_array(path, "stores", chunk_size)
+    validator = DatasetValidator(products, stores, max_violations)
+
+    for transaction, items in iter_file_transactions(path, chunk_size, validator.orphan_items):
+        validator.check(transaction, items)
+
+    return validator.report()
+
+
+def self_check():
+    """Validate a small dataset with one orphan item mid-file; returns the exit code"""
+    transactions = []
+    transaction_items = []
+    for n in range(1, 101):
+        transaction_id = f"txn_{n:05d}"
+        transactions.append({"id": transaction_id, "total_amount": 20.0, "store_id": "store_001"})
+        for k in range(2):
+            transaction_items.append({"id": f"item_{n:05d}_{k + 1:02d}", "transaction_id": transaction_id,
+                                      "product_id": "prod_001", "product_name": "Test Product",
+                                      "quantity": 1, "unit_price": 10.0, "total_amount": 10.0})
+    # An extra item pointing at a transaction that does not exist, halfway through
+    stray = dict(transaction_items[100], id="item_stray", transaction_id="txn_99999")
+    transaction_items.insert(101, stray)
+
+    fd, path = tempfile.mkstemp(suffix=".json")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump({"transactions": transactions, "transaction_items": transaction_items,
+                       "products": [{"id": "prod_001", "name": "Test Product"}]}, f)
+        # A tiny chunk size also exercises elements straddling chunk boundaries
+        report = validate_file(path, chunk_size=256)
+    finally:
+        os.remove(path)
+
+    expected = {"orphan_item": 1}
+    if report["violation_counts"] != expected or report["violations"][0]["key"] != "item_stray":
+        print(f"❌ Self-check failed: expected {expected}, got {report['violation_counts']}")
+        return 1
+    print("✅ Self-check passed: one stray item reported as exactly one orphan")
+    return 0
+
+
+def main():
+    """Validate a generated dataset file and print any violations"""
+    parser = argparse.ArgumentParser(description="Scout Analytics dataset integrity validator")
+    parser.add_argument("path", nargs="?", help="JSON file written by one of the generators")
+    parser.add_argument("--chunk-size", type=int, default=1 << 20, help="Characters read per chunk")
+    parser.add_argument("--max-violations", type=int, default=1000, help="Violations kept for the report")
+    parser.add_argument("--self-check", action="store_true",
+                        help="Check the validator itself against a dataset with a known orphan item")
+    args = parser.parse_args()
+
+    if args.self_check:
+        return self_check()
+    if args.path is None:
+        parser.error("path is required unless --self-check is given")
+
+    report = validate_file(args.path, args.chunk_size, args.max_violations)
+    return print_report(report)
+
+
+def print_report(report, limit=20):
+    """Print a validation report; returns the process exit code"""
+    print(f"🔎 Checked {report['transactions_checked']:,} transactions, "
+          f"{report['items_checked']:,} items")
+    if report["ok"]:
+        print("✅ No integrity violations found")
+        return 0
+
+    print("❌ Integrity violations:")
+    for kind, count in sorted(report["violation_counts"].items()):
+        print(f"   {kind}: {count:,}")
+    print()
+    for violation in report["violations"][:limit]:
+        print(f"   {violation['table']}[{violation['row']}] {violation['key']}: "
+              f"{violation['kind']} - {violation['detail']}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())